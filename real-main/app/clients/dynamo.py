@@ -3,10 +3,13 @@ import json
 import logging
 import os
 import re
+import time
 
 import boto3
 
 DYNAMO_TABLE = os.environ.get('DYNAMO_TABLE')
+BATCH_GET_MAX_ATTEMPTS = 6
+BATCH_GET_MAX_BACKOFF_SECONDS = 1
 logger = logging.getLogger()
 
 
@@ -53,12 +56,26 @@ class DynamoClient:
         Both the input `typed_keys` and the return value should/will be in
         verbose format, with types.
         Order *not* maintained.
+        Any keys dynamo leaves unprocessed (ex: due to throttling) are retried with capped backoff,
+        up to BATCH_GET_MAX_ATTEMPTS requests in total, after which an exception is raised.
         """
         assert len(typed_keys) <= 100, "Max 100 items per batch get request"
-        kwargs = {'RequestItems': {self.table_name: {'Keys': typed_keys}}}
+        request_items = {self.table_name: {'Keys': typed_keys}}
         if projection_expression:
-            kwargs['RequestItems'][self.table_name]['ProjectionExpression'] = projection_expression
-        return self.boto3_client.batch_get_item(**kwargs)['Responses'][self.table_name]
+            request_items[self.table_name]['ProjectionExpression'] = projection_expression
+        items = []
+        for attempt in range(BATCH_GET_MAX_ATTEMPTS):
+            if attempt:
+                time.sleep(min(2 ** attempt * 0.05, BATCH_GET_MAX_BACKOFF_SECONDS))
+            resp = self.boto3_client.batch_get_item(RequestItems=request_items)
+            items.extend(resp['Responses'].get(self.table_name, []))
+            request_items = resp.get('UnprocessedKeys')
+            if not request_items:
+                return items
+        unprocessed_cnt = len(request_items[self.table_name]['Keys'])
+        raise Exception(
+            f'Batch get left {unprocessed_cnt} keys unprocessed after {BATCH_GET_MAX_ATTEMPTS} attempts'
+        )
 
     def update_item(self, query_kwargs, failure_warning=None):
         """
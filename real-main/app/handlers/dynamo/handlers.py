@@ -61,7 +61,9 @@ register('album', '-', ['REMOVE'], user_manager.on_album_delete_update_album_cou
 # register('appStoreReceipt', '-', ['INSERT'], appstore_manager.on_receipt_add_verify)
 register('card', '-', ['INSERT'], card_manager.on_card_add)
 register('card', '-', ['INSERT'], user_manager.on_card_add_increment_count)
-register('card', '-', ['MODIFY'], card_manager.on_card_edit)
+register(
+    'card', '-', ['MODIFY'], card_manager.on_card_edit, {'title': None, 'subTitle': None, 'action': None},
+)
 register('card', '-', ['REMOVE'], card_manager.on_card_delete)
 register('card', '-', ['REMOVE'], user_manager.on_card_delete_decrement_count)
 register('chat', '-', ['REMOVE'], chat_manager.on_chat_delete_delete_memberships)
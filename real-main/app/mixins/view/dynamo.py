@@ -1,10 +1,12 @@
 import logging
 
 from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.types import TypeDeserializer
 
 from . import exceptions
 
 logger = logging.getLogger()
+deserialize = TypeDeserializer().deserialize
 
 
 class ViewDynamo:
@@ -21,18 +23,41 @@ class ViewDynamo:
     def get_view(self, item_id, user_id, strongly_consistent=False):
         return self.client.get_item(self.pk(item_id, user_id), ConsistentRead=strongly_consistent)
 
-    def generate_views(self, item_id, pks_only=False):
-        # no ordering guarantees
+    def batch_get_views(self, keys):
+        """
+        Get multiple views in one request.
+        `keys` should be an iterable of (item_id, user_id) tuples, at most 100 distinct ones.
+        Duplicate keys are ignored.
+        Returns a dict of {(item_id, user_id): view_item} for the views that exist.
+        """
+        keys = list(dict.fromkeys(keys))
+        if len(keys) > 100:
+            raise ValueError(f'Cannot batch get more than 100 views at once, got {len(keys)}')
+        if not keys:
+            return {}
+        typed_keys = [{k: {'S': v} for k, v in self.pk(item_id, user_id).items()} for item_id, user_id in keys]
+        views = {}
+        for typed_item in self.client.batch_get_items(typed_keys):
+            item = {k: deserialize(v) for k, v in typed_item.items()}
+            item_id = item['partitionKey'][len(self.item_type) + 1 :]
+            user_id = item['sortKey'][len('view/') :]
+            views[(item_id, user_id)] = item
+        return views
+
+    def _generate_views_query_kwargs(self, item_id, pks_only=False):
         pk = self.pk(item_id, None)
         query_kwargs = {
             'KeyConditionExpression': (
                 Key('partitionKey').eq(pk['partitionKey']) & Key('sortKey').begins_with('view/')
             )
         }
-        gen = self.client.generate_all_query(query_kwargs)
         if pks_only:
-            gen = ({'partitionKey': item['partitionKey'], 'sortKey': item['sortKey']} for item in gen)
-        return gen
+            query_kwargs['ProjectionExpression'] = 'partitionKey, sortKey'
+        return query_kwargs
+
+    def generate_views(self, item_id, pks_only=False):
+        # no ordering guarantees
+        return self.client.generate_all_query(self._generate_views_query_kwargs(item_id, pks_only=pks_only))
 
     def delete_view(self, item_id, user_id):
         return self.client.delete_item(self.pk(item_id, user_id))
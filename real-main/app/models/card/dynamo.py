@@ -115,6 +115,7 @@ class CardDynamo:
         query_kwargs = {
             'KeyConditionExpression': 'gsiK1PartitionKey = :c AND gsiK1SortKey < :at_trailing',
             'ExpressionAttributeValues': {':c': 'card', ':at_trailing': cutoff_at.to_iso8601_string() + '/~'},
+            'ProjectionExpression': 'partitionKey, gsiK1SortKey',
             'IndexName': 'GSI-K1',
         }
         gen = self.client.generate_all_query(query_kwargs)
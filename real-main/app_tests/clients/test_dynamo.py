@@ -0,0 +1,42 @@
+from unittest.mock import patch
+
+import pytest
+
+from app.clients.dynamo import BATCH_GET_MAX_ATTEMPTS
+
+
+@pytest.fixture
+def typed_items(dynamo_client):
+    items = [{'partitionKey': {'S': f'pk{i}'}, 'sortKey': {'S': '-'}} for i in range(2)]
+    for item in items:
+        dynamo_client.boto3_client.put_item(TableName=dynamo_client.table_name, Item=item)
+    yield items
+
+
+def test_batch_get_items_retries_unprocessed_keys(dynamo_client, typed_items):
+    table_name = dynamo_client.table_name
+    resps = [
+        {
+            'Responses': {table_name: [typed_items[0]]},
+            'UnprocessedKeys': {table_name: {'Keys': [typed_items[1]]}},
+        },
+        {'Responses': {table_name: [typed_items[1]]}, 'UnprocessedKeys': {}},
+    ]
+    with patch.object(dynamo_client.boto3_client, 'batch_get_item', side_effect=resps) as batch_get_mock:
+        with patch('app.clients.dynamo.time.sleep') as sleep_mock:
+            items = dynamo_client.batch_get_items(typed_items)
+    assert items == typed_items
+    assert batch_get_mock.call_count == 2
+    assert batch_get_mock.call_args.kwargs == {'RequestItems': {table_name: {'Keys': [typed_items[1]]}}}
+    assert sleep_mock.call_count == 1
+
+
+def test_batch_get_items_gives_up_on_unprocessed_keys(dynamo_client, typed_items):
+    table_name = dynamo_client.table_name
+    resp = {'Responses': {}, 'UnprocessedKeys': {table_name: {'Keys': typed_items}}}
+    with patch.object(dynamo_client.boto3_client, 'batch_get_item', return_value=resp) as batch_get_mock:
+        with patch('app.clients.dynamo.time.sleep') as sleep_mock:
+            with pytest.raises(Exception, match='2 keys unprocessed'):
+                dynamo_client.batch_get_items(typed_items)
+    assert batch_get_mock.call_count == BATCH_GET_MAX_ATTEMPTS
+    assert all(call.args[0] <= 1 for call in sleep_mock.call_args_list)
@@ -4,6 +4,7 @@ from os import path
 from unittest import mock
 
 import moto
+import pendulum
 import pytest
 
 from app import clients, models
@@ -55,6 +56,13 @@ def heic_dims():
     yield (4032, 3024)
 
 
+@pytest.fixture(scope='session')
+def fixed_now():
+    # for tests that just need some timestamp, rather than the actual current time
+    # non-zero microseconds so its iso8601 strings match the format pendulum.now() produces
+    yield pendulum.datetime(2024, 1, 1, 12, 0, 0, 123456, tz='utc')
+
+
 @pytest.fixture
 def appsync_client():
     yield mock.Mock(clients.AppSyncClient(appsync_graphql_url='my-graphql-url'))
@@ -1,7 +1,7 @@
 from uuid import uuid4
 
-import pendulum
 import pytest
+from boto3.dynamodb.conditions import Key
 
 from app.mixins.view.dynamo import ViewDynamo
 from app.mixins.view.exceptions import ViewAlreadyExists, ViewDoesNotExist
@@ -12,16 +12,16 @@ def view_dynamo(dynamo_client):
     yield ViewDynamo('itype', dynamo_client)
 
 
-def test_add_and_increment_view(view_dynamo):
+def test_add_and_increment_view(view_dynamo, fixed_now):
     item_id = 'iid'
     user_id = 'uid'
     view_count = 5
-    viewed_at = pendulum.now('utc')
+    viewed_at = fixed_now
     viewed_at_str = viewed_at.to_iso8601_string()
 
     # verify can't increment view that doesn't exist
     with pytest.raises(ViewDoesNotExist):
-        view_dynamo.increment_view_count(item_id, user_id, 1, pendulum.now('utc'))
+        view_dynamo.increment_view_count(item_id, user_id, 1, fixed_now)
 
     # verify the view does not exist
     assert view_dynamo.get_view(item_id, user_id) is None
@@ -41,13 +41,13 @@ def test_add_and_increment_view(view_dynamo):
 
     # verify can't add another view with same key
     with pytest.raises(ViewAlreadyExists):
-        view_dynamo.add_view(item_id, user_id, 1, pendulum.now('utc'))
+        view_dynamo.add_view(item_id, user_id, 1, fixed_now)
 
     # verify a read from the DB has the form we expect
     assert view_dynamo.get_view(item_id, user_id) == view
 
     # increment the view, verify the new form is correct
-    new_viewed_at = pendulum.now('utc')
+    new_viewed_at = fixed_now.add(minutes=1)
     view = view_dynamo.increment_view_count(item_id, user_id, view_count, new_viewed_at)
     assert view == {
         'partitionKey': 'itype/iid',
@@ -64,11 +64,18 @@ def test_add_and_increment_view(view_dynamo):
     assert view_dynamo.get_view(item_id, user_id) == view
 
 
-def test_generate_views(view_dynamo):
-    item_id = 'iid'
+def test_generate_views_query_kwargs(view_dynamo):
+    # other items sharing the partitionKey are excluded by the sortKey prefix in the query itself
+    key_condition = Key('partitionKey').eq('itype/iid') & Key('sortKey').begins_with('view/')
+    assert view_dynamo._generate_views_query_kwargs('iid') == {'KeyConditionExpression': key_condition}
+    assert view_dynamo._generate_views_query_kwargs('iid', pks_only=True) == {
+        'KeyConditionExpression': key_condition,
+        'ProjectionExpression': 'partitionKey, sortKey',
+    }
 
-    # set up a decoy item with same partitionKey
-    view_dynamo.client.add_item({'Item': {'partitionKey': 'itype/iid', 'sortKey': '-'}})
+
+def test_generate_views(view_dynamo, fixed_now):
+    item_id = 'iid'
 
     # test generating no views
     assert list(view_dynamo.generate_views(item_id)) == []
@@ -76,72 +83,103 @@ def test_generate_views(view_dynamo):
 
     # add a view, test we generate it
     user_id_1 = 'uid1'
-    view_dynamo.add_view(item_id, user_id_1, 1, pendulum.now('utc'))
+    view_dynamo.add_view(item_id, user_id_1, 1, fixed_now)
 
     views = list(view_dynamo.generate_views(item_id))
-    assert len(views) == 1
-    assert views[0]['partitionKey'] == 'itype/iid'
-    assert views[0]['sortKey'] == 'view/uid1'
-    assert views[0]['viewCount'] == 1
-
-    pks = list(view_dynamo.generate_views(item_id, pks_only=True))
-    assert len(pks) == 1
-    assert pks[0] == {'partitionKey': 'itype/iid', 'sortKey': 'view/uid1'}
+    assert [(v['partitionKey'], v['sortKey'], v['viewCount']) for v in views] == [('itype/iid', 'view/uid1', 1)]
+    assert list(view_dynamo.generate_views(item_id, pks_only=True)) == [
+        {'partitionKey': 'itype/iid', 'sortKey': 'view/uid1'}
+    ]
 
     # add another view, test they both generate
     user_id_0 = 'uid0'
-    view_dynamo.add_view(item_id, user_id_0, 2, pendulum.now('utc'))
+    view_dynamo.add_view(item_id, user_id_0, 2, fixed_now)
 
     views = list(view_dynamo.generate_views(item_id))
-    assert len(views) == 2
-    assert views[0]['partitionKey'] == 'itype/iid'
-    assert views[0]['sortKey'] == 'view/uid0'
-    assert views[0]['viewCount'] == 2
-    assert views[1]['partitionKey'] == 'itype/iid'
-    assert views[1]['sortKey'] == 'view/uid1'
-    assert views[1]['viewCount'] == 1
+    assert [(v['partitionKey'], v['sortKey'], v['viewCount']) for v in views] == [
+        ('itype/iid', 'view/uid0', 2),
+        ('itype/iid', 'view/uid1', 1),
+    ]
+    assert list(view_dynamo.generate_views(item_id, pks_only=True)) == [
+        {'partitionKey': 'itype/iid', 'sortKey': 'view/uid0'},
+        {'partitionKey': 'itype/iid', 'sortKey': 'view/uid1'},
+    ]
+
+
+def test_batch_get_views(view_dynamo, fixed_now):
+    # test empty and missing gets
+    assert view_dynamo.batch_get_views([]) == {}
+    assert view_dynamo.batch_get_views([('iid1', 'uid1')]) == {}
+
+    # add some views, get some of them
+    view11 = view_dynamo.add_view('iid1', 'uid1', 1, fixed_now)
+    view12 = view_dynamo.add_view('iid1', 'uid2', 2, fixed_now)
+    view_dynamo.add_view('iid2', 'uid1', 3, fixed_now)
+    assert view_dynamo.batch_get_views([('iid1', 'uid1'), ('iid1', 'uid2'), ('iid3', 'uid1')]) == {
+        ('iid1', 'uid1'): view11,
+        ('iid1', 'uid2'): view12,
+    }
+
+    # duplicate keys are ignored
+    assert view_dynamo.batch_get_views([('iid1', 'uid1'), ('iid1', 'uid1')]) == {('iid1', 'uid1'): view11}
 
-    pks = list(view_dynamo.generate_views(item_id, pks_only=True))
-    assert len(pks) == 2
-    assert pks[0] == {'partitionKey': 'itype/iid', 'sortKey': 'view/uid0'}
-    assert pks[1] == {'partitionKey': 'itype/iid', 'sortKey': 'view/uid1'}
+    # too many keys
+    with pytest.raises(ValueError, match='100'):
+        view_dynamo.batch_get_views([('iid1', f'uid{i}') for i in range(101)])
 
 
-def test_delete_view(view_dynamo):
+def test_delete_view(view_dynamo, fixed_now):
     # add two views, verify
     item_id1, user_id1 = [str(uuid4()), str(uuid4())]
     item_id2, user_id2 = [str(uuid4()), str(uuid4())]
-    view_dynamo.add_view(item_id1, user_id1, 1, pendulum.now('utc'))
-    view_dynamo.add_view(item_id2, user_id2, 2, pendulum.now('utc'))
-    assert view_dynamo.get_view(item_id1, user_id1)
-    assert view_dynamo.get_view(item_id2, user_id2)
+    view1 = view_dynamo.add_view(item_id1, user_id1, 1, fixed_now)
+    view2 = view_dynamo.add_view(item_id2, user_id2, 2, fixed_now)
+    assert view_dynamo.batch_get_views([(item_id1, user_id1), (item_id2, user_id2)]) == {
+        (item_id1, user_id1): view1,
+        (item_id2, user_id2): view2,
+    }
 
     # delete one of the views, verify final state
     resp = view_dynamo.delete_view(item_id1, user_id1)
     assert resp
-    assert view_dynamo.get_view(item_id1, user_id1) is None
-    assert view_dynamo.get_view(item_id2, user_id2)
+    assert view_dynamo.batch_get_views([(item_id1, user_id1), (item_id2, user_id2)]) == {
+        (item_id2, user_id2): view2,
+    }
 
     # delete a view that doesn't exist, should fail softly
     resp = view_dynamo.delete_view(item_id1, user_id1)
     assert resp is None
 
 
-def test_delete_views(view_dynamo):
+def test_delete_views(view_dynamo, fixed_now):
     # test empty delete, should not error out
     view_dynamo.delete_views(x for x in ())
 
     # add two views
-    view1 = view_dynamo.add_view('iid1', 'uid1', 1, pendulum.now('utc'))
-    view2 = view_dynamo.add_view('iid2', 'uid2', 2, pendulum.now('utc'))
+    view1 = view_dynamo.add_view('iid1', 'uid1', 1, fixed_now)
+    view2 = view_dynamo.add_view('iid2', 'uid2', 2, fixed_now)
 
     # verify we see both of those in the db
-    assert view_dynamo.get_view('iid1', 'uid1')
-    assert view_dynamo.get_view('iid2', 'uid2')
+    assert view_dynamo.batch_get_views([('iid1', 'uid1'), ('iid2', 'uid2')]) == {
+        ('iid1', 'uid1'): view1,
+        ('iid2', 'uid2'): view2,
+    }
 
     # delete them
     view_dynamo.delete_views(x for x in (view1, view2))
 
     # verify they're gone
-    assert view_dynamo.get_view('iid1', 'uid1') is None
-    assert view_dynamo.get_view('iid2', 'uid2') is None
+    assert view_dynamo.batch_get_views([('iid1', 'uid1'), ('iid2', 'uid2')]) == {}
+
+
+def test_delete_views_more_than_one_batch(view_dynamo, fixed_now):
+    # dynamo caps batch writes at 25 items, so this spans multiple requests
+    item_id = str(uuid4())
+    user_ids = [str(uuid4()) for _ in range(30)]
+    for user_id in user_ids:
+        view_dynamo.add_view(item_id, user_id, 1, fixed_now)
+    assert len(list(view_dynamo.generate_views(item_id))) == 30
+
+    # delete them all, verify they're gone
+    view_dynamo.delete_views(view_dynamo.generate_views(item_id, pks_only=True))
+    assert list(view_dynamo.generate_views(item_id)) == []
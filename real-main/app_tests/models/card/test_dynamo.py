@@ -42,14 +42,14 @@ def test_add_card_minimal(card_dynamo):
         card_dynamo.add_card(card_id, user_id, title, action)
 
 
-def test_add_card_maximal(card_dynamo):
+def test_add_card_maximal(card_dynamo, fixed_now):
     card_id = str(uuid4())
     user_id = str(uuid4())
     title = 'you should know this'
     action = 'https://some-valid-url.com'
     sub_title = 'more info for you'
-    created_at = pendulum.now('utc')
-    notify_user_at = pendulum.now('utc')
+    created_at = fixed_now
+    notify_user_at = fixed_now.add(minutes=1)
     post_id = str(uuid4())
     comment_id = str(uuid4())
 
@@ -103,10 +103,10 @@ def test_update_title(card_dynamo):
     assert org_card_item == card_item
 
 
-def test_clear_notify_user_at(card_dynamo):
+def test_clear_notify_user_at(card_dynamo, fixed_now):
     # add a card with a notify_user_at, verify
     card_id = str(uuid4())
-    org_card_item = card_dynamo.add_card(card_id, 'uid', 't', 'a', notify_user_at=pendulum.now('utc'))
+    org_card_item = card_dynamo.add_card(card_id, 'uid', 't', 'a', notify_user_at=fixed_now)
     assert 'gsiK1PartitionKey' in org_card_item
     assert 'gsiK1SortKey' in org_card_item
 
@@ -152,26 +152,23 @@ def test_generate_cards_by_user(card_dynamo):
 
     # generate the one card
     card_items = list(card_dynamo.generate_cards_by_user(user_id))
-    assert len(card_items) == 1
-    assert card_items[0]['partitionKey'] == 'card/cid1'
-    assert card_items[0]['title'] == 'title1'
+    assert [(c['partitionKey'], c['title']) for c in card_items] == [('card/cid1', 'title1')]
 
     # add another card
     card_dynamo.add_card('cid2', user_id, 'title2', 'https://c.d')
 
     # generate two cards, check order
     card_items = list(card_dynamo.generate_cards_by_user(user_id))
-    assert len(card_items) == 2
-    assert card_items[0]['partitionKey'] == 'card/cid1'
-    assert card_items[0]['title'] == 'title1'
-    assert card_items[1]['partitionKey'] == 'card/cid2'
-    assert card_items[1]['title'] == 'title2'
+    assert [(c['partitionKey'], c['title']) for c in card_items] == [
+        ('card/cid1', 'title1'),
+        ('card/cid2', 'title2'),
+    ]
 
     # generate two cards, pks_only
-    card_items = list(card_dynamo.generate_cards_by_user(user_id, pks_only=True))
-    assert len(card_items) == 2
-    assert card_items[0] == {'partitionKey': 'card/cid1', 'sortKey': '-'}
-    assert card_items[1] == {'partitionKey': 'card/cid2', 'sortKey': '-'}
+    assert list(card_dynamo.generate_cards_by_user(user_id, pks_only=True)) == [
+        {'partitionKey': 'card/cid1', 'sortKey': '-'},
+        {'partitionKey': 'card/cid2', 'sortKey': '-'},
+    ]
 
 
 def test_generate_cards_by_post(card_dynamo):
@@ -234,17 +231,17 @@ def test_generate_cards_by_comment(card_dynamo):
     ]
 
 
-def test_generate_card_ids_by_notify_user_at(card_dynamo):
+def test_generate_card_ids_by_notify_user_at(card_dynamo, fixed_now):
     # add a card with no user notification
     card_dynamo.add_card('coid', 'uoid', 'title', 'https://a.b')
 
     # generate no cards
-    card_ids = list(card_dynamo.generate_card_ids_by_notify_user_at(pendulum.now('utc')))
+    card_ids = list(card_dynamo.generate_card_ids_by_notify_user_at(fixed_now))
     assert card_ids == []
 
     # add one card
     card_id_1 = str(uuid4())
-    notify_user_at_1 = pendulum.now('utc')
+    notify_user_at_1 = fixed_now
     card_dynamo.add_card(card_id_1, 'uid', 'title1', 'https://a.b', notify_user_at=notify_user_at_1)
 
     # dont generate the card
@@ -281,9 +278,9 @@ def test_generate_card_ids_by_notify_user_at(card_dynamo):
     assert card_ids == [card_id_1, card_id_2]
 
 
-def test_generate_card_ids_by_notify_user_at_only_user_ids(card_dynamo):
+def test_generate_card_ids_by_notify_user_at_only_user_ids(card_dynamo, fixed_now):
     user_id_1, user_id_2, user_id_3 = [str(uuid4()), str(uuid4()), str(uuid4())]
-    now = pendulum.now('utc')
+    now = fixed_now
 
     # add one card for the first one, two for the second, and three for the third
     card_id_10 = card_dynamo.add_card(str(uuid4()), user_id_1, 't', 'a', notify_user_at=now)['partitionKey'][5:]